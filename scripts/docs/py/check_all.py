@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Run the link, source reference and outdated content checks over docs/ in one pass."""
+
+import argparse
+import os
+import sys
+
+from scripts.docs.py import check_links, check_outdated, check_source_refs, utils
+
+
+def _check_files(docs_dir, project_root):
+    broken = []
+    ref_issues = []
+    outdated = []
+    checked_links = 0
+
+    # The outdated check walks a slightly different set of directories
+    ref_files = set(utils.find_md_files(docs_dir))
+    outdated_files = set(
+        utils.find_md_files(docs_dir, exclude_dirs=check_outdated.EXCLUDE_DIRS)
+    )
+
+    for filepath in sorted(ref_files | outdated_files):
+        rel_filepath = os.path.relpath(filepath, project_root)
+
+        try:
+            with open(filepath, "r", encoding="utf-8") as fh:
+                content = fh.read()
+        except Exception as e:
+            print(f"Error reading {rel_filepath}: {e}")
+            continue
+
+        if filepath in ref_files:
+            links, refs = utils.scan_markdown(content)
+            file_broken, file_links = check_links.process_links(
+                links, filepath, rel_filepath, project_root
+            )
+            broken.extend(file_broken)
+            checked_links += file_links
+            ref_issues.extend(
+                check_source_refs.process_refs(refs, rel_filepath, project_root)
+            )
+
+        if filepath in outdated_files:
+            outdated.extend(
+                check_outdated.process_lines(content.split("\n"), rel_filepath)
+            )
+
+    return {
+        "broken": broken,
+        "checked_links": checked_links,
+        "ref_issues": ref_issues,
+        "outdated": outdated,
+        "ref_files": len(ref_files),
+        "outdated_files": len(outdated_files),
+    }
+
+
+def main():
+    """Main entry point for running all documentation checks."""
+    parser = argparse.ArgumentParser(description="Run all docs checks in one pass.")
+    parser.add_argument("--root", default=".", help="Project root directory")
+    parser.add_argument(
+        "--max-issues",
+        type=utils.positive_int,
+        help="Report at most N issues per check (sorted)",
+    )
+    args = parser.parse_args()
+
+    # Use project root from args if provided, otherwise detect
+    project_root = os.path.abspath(args.root)
+    if args.root == ".":
+        project_root = utils.get_project_root()
+
+    docs_dir = os.path.join(project_root, "docs")
+
+    if not os.path.exists(docs_dir):
+        print(f"Error: docs directory not found at {docs_dir}")
+        sys.exit(1)
+
+    results = _check_files(docs_dir, project_root)
+
+    status = check_links.report(
+        results["broken"],
+        results["ref_files"],
+        results["checked_links"],
+        args.max_issues,
+    )
+    status |= check_source_refs.report(
+        results["ref_issues"], results["ref_files"], args.max_issues
+    )
+    status |= check_outdated.report(results["outdated"], results["outdated_files"])
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
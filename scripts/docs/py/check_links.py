@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 import argparse
+import heapq
 import os
 import sys
 
 from scripts.docs.py import utils
 
 
-def _process_links(links, filepath, rel_filepath, project_root):
+def process_links(links, filepath, rel_filepath, project_root):
+    """
+    Resolves one file's (text, url) links against the filesystem.
+    Returns (broken, checked) where broken holds (file, text, link, target) tuples.
+    """
     broken_in_file = []
     checked_in_file = 0
 
@@ -23,7 +28,7 @@ def _process_links(links, filepath, rel_filepath, project_root):
             # Relative to current file
             target = os.path.normpath(os.path.join(os.path.dirname(filepath), link))
 
-        if not os.path.exists(target):
+        if not utils.path_exists(target):
             broken_in_file.append(
                 (rel_filepath, text, link, os.path.relpath(target, project_root))
             )
@@ -50,7 +55,7 @@ def _check_files(docs_dir, project_root):
             continue
 
         links = utils.extract_links(content)
-        file_broken, file_links = _process_links(
+        file_broken, file_links = process_links(
             links, filepath, rel_filepath, project_root
         )
 
@@ -60,10 +65,37 @@ def _check_files(docs_dir, project_root):
     return broken, checked_files, checked_links
 
 
+def report(broken, checked_files, checked_links, max_issues=None):
+    """Prints the broken link listing; returns the exit status."""
+    print(f"Checked {checked_files} files, {checked_links} internal links.")
+
+    if broken:
+        print(f"Found {len(broken)} broken internal links:")
+        if max_issues is not None:
+            shown = heapq.nsmallest(max_issues, broken)
+        else:
+            shown = sorted(broken)
+        utils.write_lines(
+            f"  {fp}: [{text}]({link}) -> {target} (missing)"
+            for fp, text, link, target in shown
+        )
+        if len(shown) < len(broken):
+            print(f"  ... and {len(broken) - len(shown)} more")
+        return 1
+
+    print("No broken internal links found.")
+    return 0
+
+
 def main():
     """Main entry point for checking broken internal links in documentation."""
     parser = argparse.ArgumentParser(description="Check broken internal links in docs.")
     parser.add_argument("--root", default=".", help="Project root directory")
+    parser.add_argument(
+        "--max-issues",
+        type=utils.positive_int,
+        help="Report at most N broken links (sorted)",
+    )
     args = parser.parse_args()
 
     # Use project root from args if provided, otherwise detect
@@ -78,17 +110,7 @@ def main():
         sys.exit(1)
 
     broken, checked_files, checked_links = _check_files(docs_dir, project_root)
-
-    print(f"Checked {checked_files} files, {checked_links} internal links.")
-
-    if broken:
-        print(f"Found {len(broken)} broken internal links:")
-        for fp, text, link, target in sorted(broken):
-            print(f"  {fp}: [{text}]({link}) -> {target} (missing)")
-        sys.exit(1)
-    else:
-        print("No broken internal links found.")
-        sys.exit(0)
+    sys.exit(report(broken, checked_files, checked_links, args.max_issues))
 
 
 if __name__ == "__main__":
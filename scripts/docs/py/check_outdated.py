@@ -8,24 +8,70 @@ import sys
 
 from scripts.docs.py import utils
 
+EXCLUDE_DIRS = {".git", "fixtures", "archive"}
+
+# Patterns to flag
+OUTDATED_PATTERNS = [
+    (r"v0\.1\.[0-9]+", "old version reference (v0.1.x)"),
+    (r"shaku", "shaku DI (superseded by dill)"),
+    (r"Shaku", "Shaku DI (superseded by dill)"),
+    (r"inventory", "inventory crate (migrated to linkme)"),
+    (r"rockets?", "Rocket web framework (migrated to Poem)"),
+    (r"mcp-context-browser", "old project name (now mcb)"),
+    (r"MCP Context Browser", "old project name (now Memory Context Browser / MCB)"),
+    (r"mcb-adapters", "old crate name (removed/renamed)"),
+    (r"mcb-core", "old crate name (split into mcb-domain + mcb-infrastructure)"),
+    (r"CODEQL_SETUP", "reference to archived doc"),
+]
+
+
+def _pattern_source(pattern):
+    # Use ignore case if pattern is lowercase
+    return f"(?i:{pattern})" if pattern.islower() else pattern
+
+
+_COMPILED_PATTERNS = [
+    (re.compile(_pattern_source(pattern)), desc) for pattern, desc in OUTDATED_PATTERNS
+]
+# Any-pattern prefilter so clean lines cost a single scan
+_ANY_OUTDATED_RE = re.compile(
+    "|".join(_pattern_source(pattern) for pattern, _ in OUTDATED_PATTERNS)
+)
+_SUPPRESSED_RE = re.compile(
+    r"superseded|historical|migrated|referenc|deprecat|NOTE|dill|poem|linkme|previous|archived|legacy|renamed|removed",
+    re.IGNORECASE,
+)
+
+
+def _find_hits(lines):
+    hits = {}
+    for line_idx, line in enumerate(lines):
+        if not _ANY_OUTDATED_RE.search(line):
+            continue
+        hits[line_idx] = {
+            pattern_id
+            for pattern_id, (pattern, _) in enumerate(_COMPILED_PATTERNS)
+            if pattern.search(line)
+        }
+    return hits
+
 
-def _process_lines(lines, rel_filepath, outdated_patterns, is_suppressed):
+def process_lines(lines, rel_filepath):
+    """Returns (file, line, description, content) tuples for outdated lines."""
     issues_in_file = []
-    for i, line in enumerate(lines, 1):
+    hits = _find_hits(lines)
+    for line_idx in sorted(hits):
+        line = lines[line_idx]
+        stripped = line.strip()
         # Skip whitespace, comments, code blocks start/end
-        if (
-            not line.strip()
-            or line.strip().startswith("<!--")
-            or line.strip().startswith("```")
-        ):
+        if not stripped or stripped.startswith(("<!--", "```")):
             continue
 
-        # Check line content
-        for pattern, desc in outdated_patterns:
-            # Use ignore case if pattern is lowercase
-            flags = re.IGNORECASE if pattern.islower() else 0
-            if re.search(pattern, line, flags) and not is_suppressed(line):
-                issues_in_file.append((rel_filepath, i, desc, line.strip()[:80]))
+        if _SUPPRESSED_RE.search(line):
+            continue
+        for pattern_id in sorted(hits[line_idx]):
+            desc = OUTDATED_PATTERNS[pattern_id][1]
+            issues_in_file.append((rel_filepath, line_idx + 1, desc, stripped[:80]))
     return issues_in_file
 
 
@@ -33,31 +79,7 @@ def _check_files(docs_dir, project_root):
     issues = []
     checked = 0
 
-    # Patterns to flag
-    OUTDATED_PATTERNS = [
-        (r"v0\.1\.[0-9]+", "old version reference (v0.1.x)"),
-        (r"shaku", "shaku DI (superseded by dill)"),
-        (r"Shaku", "Shaku DI (superseded by dill)"),
-        (r"inventory", "inventory crate (migrated to linkme)"),
-        (r"rockets?", "Rocket web framework (migrated to Poem)"),
-        (r"mcp-context-browser", "old project name (now mcb)"),
-        (r"MCP Context Browser", "old project name (now Memory Context Browser / MCB)"),
-        (r"mcb-adapters", "old crate name (removed/renamed)"),
-        (r"mcb-core", "old crate name (split into mcb-domain + mcb-infrastructure)"),
-        (r"CODEQL_SETUP", "reference to archived doc"),
-    ]
-
-    # Validation helpers
-    def is_suppressed(line):
-        return re.search(
-            r"superseded|historical|migrated|referenc|deprecat|NOTE|dill|poem|linkme|previous|archived|legacy|renamed|removed",
-            line,
-            re.IGNORECASE,
-        )
-
-    md_files = utils.find_md_files(
-        docs_dir, exclude_dirs={".git", "fixtures", "archive"}
-    )
+    md_files = utils.find_md_files(docs_dir, exclude_dirs=EXCLUDE_DIRS)
 
     for filepath in md_files:
         rel_filepath = os.path.relpath(filepath, project_root)
@@ -70,14 +92,28 @@ def _check_files(docs_dir, project_root):
             print(f"Error reading {rel_filepath}: {e}")
             continue
 
-        file_issues = _process_lines(
-            lines, rel_filepath, OUTDATED_PATTERNS, is_suppressed
-        )
-        issues.extend(file_issues)
+        issues.extend(process_lines(lines, rel_filepath))
 
     return issues, checked
 
 
+def report(issues, checked):
+    """Prints the outdated content listing; returns the exit status."""
+    print(f"Checked {checked} files for outdated content.")
+
+    if issues:
+        print(f"Found {len(issues)} potential outdated references:")
+        utils.write_lines(
+            f"  {fp}:{lineno} [{desc}] {content}"
+            for fp, lineno, desc, content in sorted(issues)
+        )
+        # Return 0 for now as these are often false positives or acceptable history
+        return 0
+
+    print("No outdated content found.")
+    return 0
+
+
 def main():
     """Main entry point for outdated documentation check."""
     parser = argparse.ArgumentParser(description="Check outdated content in docs.")
@@ -96,18 +132,7 @@ def main():
         sys.exit(1)
 
     issues, checked = _check_files(docs_dir, project_root)
-
-    print(f"Checked {checked} files for outdated content.")
-
-    if issues:
-        print(f"Found {len(issues)} potential outdated references:")
-        for fp, lineno, desc, content in sorted(issues):
-            print(f"  {fp}:{lineno} [{desc}] {content}")
-        # Return 0 for now as these are often false positives or acceptable history
-        sys.exit(0)
-    else:
-        print("No outdated content found.")
-        sys.exit(0)
+    sys.exit(report(issues, checked))
 
 
 if __name__ == "__main__":
@@ -2,13 +2,31 @@
 """Scan docs/ for references to source paths that don't exist."""
 
 import argparse
+import heapq
 import os
-import re
 import sys
 
 from scripts.docs.py import utils
 
 
+def process_refs(refs, rel_filepath, project_root):
+    """Returns (file, ref) tuples for the refs that resolve to no path."""
+    issues_in_file = []
+    for ref in refs:
+        # Basic filter: exclude things that look like commands or snippets with spaces
+        if " " in ref or "(" in ref or "::" in ref or "..." in ref:
+            continue
+
+        # Resolve checking existence
+        target = os.path.join(project_root, ref.rstrip("/"))
+
+        # Check directly or check if it's a file without extension (directories)
+        # Also try checking if it's a Rust file reference without .rs extension (common in docs)
+        if not utils.path_exists(target) and not utils.path_exists(target + ".rs"):
+            issues_in_file.append((rel_filepath, ref))
+    return issues_in_file
+
+
 def _check_files(docs_dir, project_root):
     issues = []
     checked = 0
@@ -26,26 +44,30 @@ def _check_files(docs_dir, project_root):
             print(f"Error reading {rel_filepath}: {e}")
             continue
 
-        # Strip comments
-        content = re.sub(r"<!--.*?-->", "", content, flags=re.DOTALL)
+        refs = utils.extract_source_refs(content)
+        issues.extend(process_refs(refs, rel_filepath, project_root))
 
-        # Find references like `crates/mcb-xxx/src/...`
-        refs = re.findall(r"`(crates/[^`]+)`", content)
+    return issues, checked
 
-        for ref in refs:
-            # Basic filter: exclude things that look like commands or snippets with spaces
-            if " " in ref or "(" in ref or "::" in ref or "..." in ref:
-                continue
 
-            # Resolve checking existence
-            target = os.path.join(project_root, ref.rstrip("/"))
+def report(issues, checked, max_issues=None):
+    """Prints the broken reference listing; returns the exit status."""
+    print(f"Checked source refs in {checked} docs")
 
-            # Check directly or check if it's a file without extension (directories)
-            # Also try checking if it's a Rust file reference without .rs extension (common in docs)
-            if not os.path.exists(target) and not os.path.exists(target + ".rs"):
-                issues.append((rel_filepath, ref))
+    if issues:
+        print(f"Found {len(issues)} broken source references:")
+        unique = set(issues)
+        if max_issues is not None:
+            shown = heapq.nsmallest(max_issues, unique)
+        else:
+            shown = sorted(unique)
+        utils.write_lines(f"  {fp}: `{ref}` -> Not found" for fp, ref in shown)
+        if len(shown) < len(unique):
+            print(f"  ... and {len(unique) - len(shown)} more")
+        return 1
 
-    return issues, checked
+    print("No broken source references found.")
+    return 0
 
 
 def main():
@@ -54,6 +76,11 @@ def main():
         description="Check broken source references in docs."
     )
     parser.add_argument("--root", default=".", help="Project root directory")
+    parser.add_argument(
+        "--max-issues",
+        type=utils.positive_int,
+        help="Report at most N broken references (sorted)",
+    )
     args = parser.parse_args()
 
     # Use project root from args if provided, otherwise detect
@@ -68,17 +95,7 @@ def main():
         sys.exit(1)
 
     issues, checked = _check_files(docs_dir, project_root)
-
-    print(f"Checked source refs in {checked} docs")
-
-    if issues:
-        print(f"Found {len(issues)} broken source references:")
-        for fp, ref in sorted(set(issues)):
-            print(f"  {fp}: `{ref}` -> Not found")
-        sys.exit(1)
-    else:
-        print("No broken source references found.")
-        sys.exit(0)
+    sys.exit(report(issues, checked, args.max_issues))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,17 @@
+import argparse
 import os
 import re
+import sys
+
+# HTML comments are stripped before scanning to avoid false positives in templates
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+# Captures: 1=text, 2=url (without anchor)
+_LINK_RE = re.compile(r"\[([^\]]*)\]\(([^)#\s]+)(?:#[^)]*)?\)")
+# References like `crates/mcb-xxx/src/...`
+_SOURCE_REF_RE = re.compile(r"`(crates/[^`]+)`")
+
+# Paths known to exist (or not), seeded from directory walks
+_EXISTS_CACHE = {}
 
 
 def get_project_root():
@@ -8,6 +20,22 @@ def get_project_root():
     return os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../"))
 
 
+def positive_int(value):
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def write_lines(lines):
+    """
+    Writes an issue listing to stdout, one line per item.
+    The listing is joined and written once rather than with a print() per line.
+    """
+    sys.stdout.write("".join(f"{line}\n" for line in lines))
+
+
 def find_md_files(root_dir, exclude_dirs=None):
     """
     Recursively finds all .md files in root_dir, skipping excluded directories.
@@ -17,6 +45,16 @@ def find_md_files(root_dir, exclude_dirs=None):
 
     md_files = []
     for root, dirs, files in os.walk(root_dir):
+        # Everything listed by the walk exists, except dangling symlinks (which
+        # os.walk reports as files); those are left to path_exists()
+        _EXISTS_CACHE[root] = True
+        for name in dirs:
+            _EXISTS_CACHE[os.path.join(root, name)] = True
+        for name in files:
+            path = os.path.join(root, name)
+            if not os.path.islink(path):
+                _EXISTS_CACHE[path] = True
+
         # Filter excludes in-place to prevent traversing them
         # We start iterating from a copy of the list to safely modify it
         dirs[:] = [d for d in dirs if d not in exclude_dirs and not d.startswith(".")]
@@ -25,14 +63,42 @@ def find_md_files(root_dir, exclude_dirs=None):
     return md_files
 
 
+def path_exists(path):
+    """
+    Cached os.path.exists(), pre-seeded by find_md_files.
+    Only paths not seen during a walk hit the filesystem, once each.
+    """
+    exists = _EXISTS_CACHE.get(path)
+    if exists is None:
+        exists = _EXISTS_CACHE[path] = os.path.exists(path)
+    return exists
+
+
+def strip_comments(content):
+    """Removes HTML comments from markdown content."""
+    return _COMMENT_RE.sub("", content)
+
+
 def extract_links(content):
     """
     Extracts links from markdown content.
     Returns list of (text, url) tuples.
     """
-    # Strip HTML comments to avoid false positives in templates
-    content = re.sub(r"<!--.*?-->", "", content, flags=re.DOTALL)
+    return _LINK_RE.findall(strip_comments(content))
+
 
-    # Find links [text](url)
-    # Regex captures: 1=text, 2=url (without anchor)
-    return re.findall(r"\[([^\]]*)\]\(([^)#\s]+)(?:#[^)]*)?\)", content)
+def extract_source_refs(content):
+    """
+    Extracts `crates/...` source references from markdown content.
+    Returns list of path strings.
+    """
+    return _SOURCE_REF_RE.findall(strip_comments(content))
+
+
+def scan_markdown(content):
+    """
+    Extracts links and source references with a single comment strip.
+    Returns (links, refs), matching extract_links() and extract_source_refs().
+    """
+    text = strip_comments(content)
+    return _LINK_RE.findall(text), _SOURCE_REF_RE.findall(text)
@@ -357,10 +357,11 @@ run_structure_validation() {
 	print_summary "Structure Validation"
 }
 
-validate_outdated_content() {
-	log_info "Scanning for outdated content patterns..."
+validate_docs_content() {
+	log_info "Checking internal links, source references and outdated content..."
 	if check_executable python3; then
-		python3 "$SCRIPT_DIR/py/check_outdated.py" --root "$PROJECT_ROOT" || true
+		# The checkers import scripts.docs.py, so the project root must be importable
+		PYTHONPATH="$PROJECT_ROOT" python3 "$SCRIPT_DIR/py/check_all.py" --root "$PROJECT_ROOT" || true
 	fi
 }
 
@@ -371,7 +372,7 @@ run_link_validation() {
 
 	validate_doc_links
 	validate_cross_references
-	validate_outdated_content
+	validate_docs_content
 
 	if [[ -n "${QUICK:-}" ]] && [[ "${QUICK}" != "0" ]]; then
 		log_info "QUICK=1: skipping external link validation"
@@ -1,9 +1,26 @@
-import json
+try:
+    import orjson
+
+    def _loads(raw):
+        return orjson.loads(raw)
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    import json
+
+    def _loads(raw):
+        return json.loads(raw)
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 
 report_path = "/home/marlonsc/mcb/reports/mcb-validate-internal-report.json"
 
-with open(report_path, "r") as f:
-    data = json.load(f)
+with open(report_path, "rb") as f:
+    data = _loads(f.read())
 
 target_file = "/home/marlonsc/mcb/crates/mcb-server/src/error_mapping.rs"
 
@@ -12,18 +29,17 @@ by_cat_delta = {}
 
 new_violations_by_category = {}
 for category, violations in data["violations_by_category"].items():
-    kept_violations = []
-    cat_removed = 0
-    for v in violations:
-        if v.get("file") == target_file or target_file in v.get("message", ""):
-            cat_removed += 1
-            removed_count += 1
-        else:
-            kept_violations.append(v)
+    kept_violations = [
+        v
+        for v in violations
+        if v.get("file") != target_file and target_file not in v.get("message", "")
+    ]
+    cat_removed = len(violations) - len(kept_violations)
 
     new_violations_by_category[category] = kept_violations
     if cat_removed > 0:
         by_cat_delta[category] = cat_removed
+        removed_count += cat_removed
 
 data["violations_by_category"] = new_violations_by_category
 
@@ -32,8 +48,8 @@ for category, delta in by_cat_delta.items():
     if category in data["summary"]["by_category"]:
         data["summary"]["by_category"][category] -= delta
 
-with open(report_path, "w") as f:
-    json.dump(data, f, indent=2)
+with open(report_path, "wb") as f:
+    f.write(_dumps(data))
 
 print(f"Removed {removed_count} violations for {target_file}")
 print(f"Categories affected: {by_cat_delta}")
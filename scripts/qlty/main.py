@@ -1,19 +1,21 @@
 """Main CLI entry point for qlty analysis."""
 
 import argparse
+import fnmatch
+import re
 import sys
+from collections.abc import Callable
 from pathlib import Path
 
-from qlty.model import SarifIssue, Severity
-from qlty.parser import parse_sarif_file
-from qlty.report import analyze_issues
-from qlty.runner import run_qlty_check, run_qlty_smells
+from qlty.model import IssuePredicate, SarifIssue, Severity
 
 
 def _load_checks_from_file(
     args: argparse.Namespace, all_issues: list[SarifIssue]
 ) -> bool:
     if args.checks_file and args.checks_file.exists():
+        from qlty.parser import parse_sarif_file
+
         print(f"📖 Reading checks from {args.checks_file}")
         checks = parse_sarif_file(args.checks_file)
         for check in checks:
@@ -28,6 +30,8 @@ def _collect_smells_issues(
     args: argparse.Namespace, all_issues: list[SarifIssue]
 ) -> None:
     if args.smells_file.exists() and not args.scan:
+        from qlty.parser import parse_sarif_file
+
         print(f"📖 Reading smells from {args.smells_file}")
         smells = parse_sarif_file(args.smells_file)
         for smell in smells:
@@ -35,6 +39,9 @@ def _collect_smells_issues(
         all_issues.extend(smells)
         print(f"   Found {len(smells)} code smells")
     elif args.scan:
+        # Only scans need the subprocess runner
+        from qlty.runner import run_qlty_smells
+
         smells = run_qlty_smells(args.smells_file or Path("qlty.smells.sarif"))
         all_issues.extend(smells)
     else:
@@ -45,6 +52,8 @@ def _collect_checks_issues(
     args: argparse.Namespace, all_issues: list[SarifIssue]
 ) -> None:
     if args.scan:
+        from qlty.runner import run_qlty_check
+
         outfile = (
             args.checks_file if args.checks_file else Path("qlty.check.current.sarif")
         )
@@ -80,6 +89,20 @@ def _collect_all_issues(args: argparse.Namespace) -> list[SarifIssue]:
         do_checks = args.check
         do_smells = args.smells
 
+    if args.scan and do_checks and do_smells:
+        # Independent scans; run them side by side
+        from qlty.runner import run_qlty_both
+
+        checks, smells = run_qlty_both(
+            args.checks_file or Path("qlty.check.current.sarif"),
+            args.smells_file or Path("qlty.smells.sarif"),
+        )
+        for check in checks:
+            check.category = "check"
+        all_issues.extend(checks)
+        all_issues.extend(smells)
+        return all_issues
+
     if do_checks:
         _collect_checks_issues(args, all_issues)
 
@@ -89,77 +112,74 @@ def _collect_all_issues(args: argparse.Namespace) -> list[SarifIssue]:
     return all_issues
 
 
-def _apply_severity_filter(
-    args: argparse.Namespace, filtered: list[SarifIssue]
-) -> list[SarifIssue]:
+def _literal_union(needles: list[str]) -> Callable[[str], re.Match[str] | None]:
+    """Search function matching any of the given substrings."""
+    return re.compile("|".join(map(re.escape, needles))).search
+
+
+def _build_filters(args: argparse.Namespace) -> list[tuple[str, IssuePredicate]]:
+    """Translate filter and exclusion flags into (description, predicate) pairs."""
+    # Ordered cheapest first (int compare, substring, regex, glob) so all()
+    # short-circuits before the fnmatch calls
+    filters: list[tuple[str, IssuePredicate]] = []
+
     if args.severity:
         target_sev = Severity.from_str(args.severity)
-        filtered = [i for i in filtered if i.level == target_sev]
-        print(f"🔍 Filtered to {len(filtered)} {args.severity} issues")
-    return filtered
-
+        filters.append((f"severity '{args.severity}'", lambda i: i.level == target_sev))
 
-def _apply_rule_filter(
-    args: argparse.Namespace, filtered: list[SarifIssue]
-) -> list[SarifIssue]:
     if args.rule:
-        filtered = [i for i in filtered if args.rule in i.rule_id]
-        print(f"🔍 Filtered to {len(filtered)} issues matching rule '{args.rule}'")
-    return filtered
+        rule = args.rule
+        filters.append((f"rule '{rule}'", lambda i: rule in i.rule_id))
 
-
-def _apply_category_filter(
-    args: argparse.Namespace, filtered: list[SarifIssue]
-) -> list[SarifIssue]:
     if args.category:
-        filtered = [i for i in filtered if args.category in i.rule_category]
-        print(f"🔍 Filtered to {len(filtered)} issues in category '{args.category}'")
-    return filtered
-
-
-def _apply_file_filter(
-    args: argparse.Namespace, filtered: list[SarifIssue]
-) -> list[SarifIssue]:
-    if args.file:
-        import fnmatch
-
-        filtered = [i for i in filtered if fnmatch.fnmatch(i.file_path, args.file)]
-        print(f"🔍 Filtered to {len(filtered)} issues in files matching '{args.file}'")
-    return filtered
-
+        category = args.category
+        filters.append(
+            (f"category '{category}'", lambda i: category in i.rule_category)
+        )
 
-def _apply_exclude_rule_filter(
-    args: argparse.Namespace, filtered: list[SarifIssue]
-) -> list[SarifIssue]:
+    # A single exclusion is a plain `not in`; several collapse into one literal
+    # alternation scanned by the regex engine
     if args.exclude_rule:
-        for rule in args.exclude_rule:
-            filtered = [i for i in filtered if rule not in i.rule_id]
-            print(f"🔍 Excluded issues matching rule '{rule}'")
-    return filtered
-
+        rule_desc = ", ".join(f"excluding rule '{r}'" for r in args.exclude_rule)
+        if len(args.exclude_rule) == 1:
+            excluded_rule = args.exclude_rule[0]
+            filters.append((rule_desc, lambda i: excluded_rule not in i.rule_id))
+        else:
+            rule_re = _literal_union(args.exclude_rule)
+            filters.append((rule_desc, lambda i: not rule_re(i.rule_id)))
 
-def _apply_exclude_category_filter(
-    args: argparse.Namespace, filtered: list[SarifIssue]
-) -> list[SarifIssue]:
     if args.exclude_category:
-        for cat in args.exclude_category:
-            filtered = [i for i in filtered if cat not in i.rule_category]
-            print(f"🔍 Excluded issues in category '{cat}'")
-    return filtered
+        cat_desc = ", ".join(f"excluding category '{c}'" for c in args.exclude_category)
+        if len(args.exclude_category) == 1:
+            excluded_cat = args.exclude_category[0]
+            filters.append((cat_desc, lambda i: excluded_cat not in i.rule_category))
+        else:
+            cat_re = _literal_union(args.exclude_category)
+            filters.append((cat_desc, lambda i: not cat_re(i.rule_category)))
 
+    if args.file:
+        file_glob = args.file
+        file_match = re.compile(fnmatch.translate(file_glob)).match
+        filters.append(
+            (
+                f"files matching '{file_glob}'",
+                lambda i: file_match(i.file_path) is not None,
+            )
+        )
 
-def _apply_exclude_file_filter(
-    args: argparse.Namespace, filtered: list[SarifIssue]
-) -> list[SarifIssue]:
     if args.exclude_file:
-        import fnmatch
+        # All excluded globs share one alternation, like the substring exclusions
+        exclude_match = re.compile(
+            "|".join(map(fnmatch.translate, args.exclude_file))
+        ).match
+        filters.append(
+            (
+                ", ".join(f"excluding files matching '{p}'" for p in args.exclude_file),
+                lambda i: exclude_match(i.file_path) is None,
+            )
+        )
 
-        for pattern in args.exclude_file:
-            filtered = [
-                i for i in filtered if not fnmatch.fnmatch(i.file_path, pattern)
-            ]
-            print(f"🔍 Excluded issues in files matching '{pattern}'")
-    return filtered
+    return filters
 
 
 def main() -> None:
@@ -249,30 +269,27 @@ def main() -> None:
         print("✅ No issues found to analyze")
         return
 
-    # Apply filters
-    filtered = all_issues
-    filtered = _apply_severity_filter(args, filtered)
-    filtered = _apply_rule_filter(args, filtered)
-    filtered = _apply_category_filter(args, filtered)
-    filtered = _apply_file_filter(args, filtered)
-    filtered = _apply_exclude_rule_filter(args, filtered)
-    filtered = _apply_exclude_category_filter(args, filtered)
-    filtered = _apply_exclude_file_filter(args, filtered)
-
-    if not filtered:
+    # Filter and analyze in the same pass
+    from qlty.report import analyze_issues
+
+    filters = _build_filters(args)
+    report = analyze_issues(all_issues, [predicate for _, predicate in filters])
+
+    if filters:
+        described = ", ".join(description for description, _ in filters)
+        print(f"🔍 Filtered to {report.total_issues} issues ({described})")
+
+    if not report.total_issues:
         print("✅ No issues matched filters")
         return
 
-    # Analyze
-    report = analyze_issues(filtered)
-
     # Print summary
     print("\n" + report.generate_summary())
 
     # Generate Markdown Report
     if not args.summary_only:
-        md_content = report.generate_markdown()
-        args.report_file.write_text(md_content, encoding="utf-8")
+        with args.report_file.open("w", encoding="utf-8", buffering=1 << 16) as fh:
+            report.write_markdown(fh)
         print(f"\n📝 Detailed report written to {args.report_file}")
 
 
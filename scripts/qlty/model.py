@@ -1,9 +1,14 @@
 """Core data models for qlty analysis."""
 
+import sys
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import Any
 
+# Indexed by Severity value (NONE, INFO, WARNING, ERROR)
+_SEVERITY_EMOJI = ("⚪", "🔵", "🟠", "🔴")
+
 
 class Severity(IntEnum):
     """Severity levels mapped from SARIF."""
@@ -15,23 +20,21 @@ class Severity(IntEnum):
 
     @classmethod
     def from_str(cls, s: str) -> "Severity":
-        mapping = {
-            "error": cls.ERROR,
-            "warning": cls.WARNING,
-            "note": cls.INFO,
-        }
-        return mapping.get(s.lower(), cls.NONE)
+        return SEVERITY_BY_LEVEL.get(s.lower(), cls.NONE)
 
     def to_emoji(self) -> str:
-        return {
-            self.ERROR: "🔴",
-            self.WARNING: "🟠",
-            self.INFO: "🔵",
-            self.NONE: "⚪",
-        }[self]
+        return _SEVERITY_EMOJI[self]
+
+
+# SARIF level -> Severity, built once instead of per from_str() call
+SEVERITY_BY_LEVEL = {
+    "error": Severity.ERROR,
+    "warning": Severity.WARNING,
+    "note": Severity.INFO,
+}
 
 
-@dataclass
+@dataclass(slots=True)
 class SarifIssue:
     """Unified representation of a SARIF result (check or smell)."""
 
@@ -45,6 +48,14 @@ class SarifIssue:
     help_uri: str = ""
     metadata: dict[str, Any] = field(default_factory=dict)
     fingerprints: dict[str, str] = field(default_factory=dict)
+    rule_category: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Extract category once from rule_id (e.g., 'rustfmt', 'zizmor', 'osv-scanner')
+        # partition() stops at the first colon and tells us whether there was one
+        category, sep, _ = self.rule_id.partition(":")
+        # Only a handful of categories exist; share one string per category
+        self.rule_category = sys.intern(category) if sep else "unknown"
 
     @property
     def location_str(self) -> str:
@@ -52,9 +63,6 @@ class SarifIssue:
             return f"{self.file_path}:{self.start_line}-{self.end_line}"
         return f"{self.file_path}:{self.start_line}"
 
-    @property
-    def rule_category(self) -> str:
-        """Extract category from rule_id (e.g., 'rustfmt', 'zizmor', 'osv-scanner')."""
-        if ":" in self.rule_id:
-            return self.rule_id.split(":")[0]
-        return "unknown"
+
+# Filter applied to issues before analysis
+IssuePredicate = Callable[[SarifIssue], bool]
@@ -1,58 +1,84 @@
 """SARIF parsing logic."""
 
-import json
+import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import Any
 
-from qlty.model import SarifIssue, Severity
+from qlty.model import SEVERITY_BY_LEVEL, SarifIssue, Severity
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads  # type: ignore[assignment]
+
+try:
+    import ijson  # type: ignore[import-not-found,import-untyped]
+except ImportError:
+    ijson = None
+
+# Above this size results are streamed one at a time (when ijson is installed)
+# instead of materializing the whole document
+_STREAM_THRESHOLD = 32 << 20
 
 
 def parse_sarif_file(path: Path) -> list[SarifIssue]:
     """Parse SARIF JSON and extract all issues."""
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    if ijson is not None and path.stat().st_size > _STREAM_THRESHOLD:
+        # Pull results straight off the file; the document is never held whole
+        with path.open("rb") as fh:
+            return _parse_results(
+                ijson.items(fh, "runs.item.results.item", use_float=True)
+            )
+
+    return _parse_results(_iter_results(_loads(path.read_bytes())))
+
 
-    issues = []
+def _iter_results(data: dict[str, Any]) -> Iterator[dict[str, Any]]:
     for run in data.get("runs", []):
-        results = run.get("results", [])
-        for result in results:
-            rule_id = result.get("ruleId", "unknown")
-            level_str = result.get("level", "note")
-            level = Severity.from_str(level_str)
-            message = result.get("message", {}).get("text", "")
-
-            # Extract location
-            locations = result.get("locations", [])
-            if not locations:
-                continue
-
-            physical_loc = locations[0].get("physicalLocation", {})
-            artifact_loc = physical_loc.get("artifactLocation", {})
-            file_path = artifact_loc.get("uri", "unknown")
-
-            region = physical_loc.get("region", {})
-            start_line = region.get("startLine", 0)
-            end_line = region.get("endLine", start_line)
-
-            # Extract metadata and fingerprints
-            metadata = {}
-            if "properties" in result:
-                metadata = result["properties"]
-
-            fingerprints = result.get("partialFingerprints", {})
-            if not fingerprints:
-                fingerprints = result.get("fingerprints", {})
-
-            issues.append(
-                SarifIssue(
-                    rule_id=rule_id,
-                    level=level,
-                    message=message,
-                    file_path=file_path,
-                    start_line=start_line,
-                    end_line=end_line,
-                    metadata=metadata,
-                    fingerprints=fingerprints,
-                )
+        yield from run.get("results", [])
+
+
+def _parse_results(results: Iterable[dict[str, Any]]) -> list[SarifIssue]:
+    issues: list[SarifIssue] = []
+    # Bind the per-result helpers once; the loop below runs for every result
+    append = issues.append
+    intern = sys.intern
+    issue_cls = SarifIssue
+    level_of = SEVERITY_BY_LEVEL.get
+    no_level = Severity.NONE
+    for result in results:
+        # Results without a location are dropped; check before any other work
+        locations = result.get("locations")
+        if not locations:
+            continue
+        get = result.get
+
+        # Few distinct rules/files repeat across many results; share the strings
+        rule_id = intern(get("ruleId", "unknown"))
+        level = level_of(get("level", "note").lower(), no_level)
+        message = get("message", {}).get("text", "")
+
+        # Extract location
+        physical_loc = locations[0].get("physicalLocation", {})
+        artifact_loc = physical_loc.get("artifactLocation", {})
+        file_path = intern(artifact_loc.get("uri", "unknown"))
+
+        region = physical_loc.get("region", {})
+        start_line = region.get("startLine", 0)
+        end_line = region.get("endLine", start_line)
+
+        append(
+            issue_cls(
+                rule_id=rule_id,
+                level=level,
+                message=message,
+                file_path=file_path,
+                start_line=start_line,
+                end_line=end_line,
+                metadata=get("properties") or {},
+                fingerprints=get("partialFingerprints") or get("fingerprints", {}),
             )
+        )
 
     return issues
@@ -1,206 +1,218 @@
 """Reporting and analysis logic."""
 
-from collections import Counter, defaultdict
+import io
+from collections import Counter
+from collections.abc import Sequence
 from dataclasses import dataclass, field
+from functools import cache
+from operator import attrgetter
+from typing import TextIO
 
-from qlty.model import SarifIssue, Severity
+from qlty.model import IssuePredicate, SarifIssue, Severity
 from qlty.strategies import get_strategy
 
+# Order in which severities are listed in summaries and reports
+_SEVERITY_ORDER = (Severity.ERROR, Severity.WARNING, Severity.INFO)
+
+# Horizontal rule framing the terminal summary
+_RULE = "━" * 72
+
+
+@cache
+def _strategy_block(rule: str) -> str:
+    """Markdown block describing the fix strategy for a rule (empty if none)."""
+    strategy = get_strategy(rule)
+    if not strategy:
+        return ""
+    # Ensure blank line before list for MD032 compliance
+    instructions = strategy.instructions.replace(":\n-", ":\n\n-")
+    return f"**Strategy:** {strategy.title}\n\n{instructions}\n\n"
+
 
 @dataclass
 class AnalysisReport:
     """Statistical analysis of SARIF issues."""
 
     total_issues: int = 0
-    by_severity: Counter = field(default_factory=Counter)
+    # Issue count per severity, indexed by the Severity value
+    sev_counts: list[int] = field(default_factory=lambda: [0] * len(Severity))
     by_rule: Counter = field(default_factory=Counter)
     by_category: Counter = field(default_factory=Counter)
     by_file: Counter = field(default_factory=Counter)
     top_files: list[tuple[str, int]] = field(default_factory=list)
     top_rules: list[tuple[str, int]] = field(default_factory=list)
     issues: list[SarifIssue] = field(default_factory=list)
+    # Issues bucketed by severity, then rule (in first-seen order)
+    by_sev_rule: dict[Severity, dict[str, list[SarifIssue]]] = field(
+        default_factory=dict
+    )
+
+    @property
+    def by_severity(self) -> Counter:
+        """Issue counts keyed by Severity (built from sev_counts)."""
+        counts = self.sev_counts
+        return Counter({sev: counts[sev] for sev in Severity if counts[sev]})
 
     def generate_summary(self) -> str:
         """Generate human-readable summary."""
-        lines = []
-        lines.append("━" * 72)
-        lines.append(f"📊 ANALYSIS SUMMARY: {self.total_issues} issues")
-        lines.append("━" * 72)
-        lines.append("")
+        buf = io.StringIO()
+        w = buf.write
+        w(_RULE + "\n")
+        w(f"📊 ANALYSIS SUMMARY: {self.total_issues} issues\n")
+        w(_RULE + "\n\n")
 
         # Severity breakdown
-        lines.append("## By Severity")
-        lines.append("")
-        for sev in [Severity.ERROR, Severity.WARNING, Severity.INFO]:
-            count = self.by_severity.get(sev, 0)
+        w("## By Severity\n\n")
+        for sev in _SEVERITY_ORDER:
+            count = self.sev_counts[sev]
             pct = (count / self.total_issues * 100) if self.total_issues > 0 else 0
-            lines.append(f"{sev.to_emoji()} {sev.name:8s} {count:4d} ({pct:5.1f}%)")
-        lines.append("")
+            w(f"{sev.to_emoji()} {sev.name:8s} {count:4d} ({pct:5.1f}%)\n")
+        w("\n")
 
         # Category breakdown
-        lines.append("## By Category")
-        lines.append("")
+        w("## By Category\n\n")
         for cat, count in self.by_category.most_common(10):
             pct = (count / self.total_issues * 100) if self.total_issues > 0 else 0
-            lines.append(f"  {cat:20s} {count:4d} ({pct:5.1f}%)")
-        lines.append("")
+            w(f"  {cat:20s} {count:4d} ({pct:5.1f}%)\n")
+        w("\n")
 
         # Top rules
-        lines.append("## Top 10 Rules")
-        lines.append("")
+        w("## Top 10 Rules\n\n")
         for rule, count in self.top_rules[:10]:
             pct = (count / self.total_issues * 100) if self.total_issues > 0 else 0
-            lines.append(f"  {count:4d} ({pct:5.1f}%)  {rule}")
-        lines.append("")
+            w(f"  {count:4d} ({pct:5.1f}%)  {rule}\n")
+        w("\n")
 
         # Top files
-        lines.append("## Top 10 Files")
-        lines.append("")
+        w("## Top 10 Files\n\n")
         for file_path, count in self.top_files[:10]:
-            lines.append(f"  {count:4d}  {file_path}")
-        lines.append("")
-
-        lines.append("━" * 72)
-        return "\\n".join(lines)
-
-    def _generate_severity_table(self, lines: list[str]) -> None:
-        lines.append("## Severity Distribution")
-        lines.append("")
-        lines.append("| Severity | Count | Percentage |")
-        lines.append("| ---------- | ------- | ------------ |")
-        for sev in [Severity.ERROR, Severity.WARNING, Severity.INFO]:
-            count = self.by_severity.get(sev, 0)
+            w(f"  {count:4d}  {file_path}\n")
+        w("\n")
+
+        w(_RULE)
+        return buf.getvalue()
+
+    def _write_severity_table(self, out: TextIO) -> None:
+        out.write("## Severity Distribution\n\n")
+        out.write("| Severity | Count | Percentage |\n")
+        out.write("| ---------- | ------- | ------------ |\n")
+        for sev in _SEVERITY_ORDER:
+            count = self.sev_counts[sev]
             pct = (count / self.total_issues * 100) if self.total_issues > 0 else 0
-            lines.append(f"| {sev.to_emoji()} {sev.name} | {count} | {pct:.1f}% |")
-        lines.append("")
-
-    def _generate_category_table(self, lines: list[str]) -> None:
-        lines.append("## Category Breakdown")
-        lines.append("")
-        lines.append("| Category | Count | Percentage |")
-        lines.append("| ---------- | ------- | ------------ |")
+            out.write(f"| {sev.to_emoji()} {sev.name} | {count} | {pct:.1f}% |\n")
+        out.write("\n")
+
+    def _write_category_table(self, out: TextIO) -> None:
+        out.write("## Category Breakdown\n\n")
+        out.write("| Category | Count | Percentage |\n")
+        out.write("| ---------- | ------- | ------------ |\n")
         for cat, count in self.by_category.most_common():
             pct = (count / self.total_issues * 100) if self.total_issues > 0 else 0
-            lines.append(f"| {cat} | {count} | {pct:.1f}% |")
-        lines.append("")
-
-    def _generate_rules_table(self, lines: list[str]) -> None:
-        lines.append("## Top Rules")
-        lines.append("")
-        lines.append("| Rule | Count | Percentage |")
-        lines.append("| ------ | ------- | ------------ |")
+            out.write(f"| {cat} | {count} | {pct:.1f}% |\n")
+        out.write("\n")
+
+    def _write_rules_table(self, out: TextIO) -> None:
+        out.write("## Top Rules\n\n")
+        out.write("| Rule | Count | Percentage |\n")
+        out.write("| ------ | ------- | ------------ |\n")
         for rule, count in self.top_rules[:20]:
             pct = (count / self.total_issues * 100) if self.total_issues > 0 else 0
-            lines.append(f"| `{rule}` | {count} | {pct:.1f}% |")
-        lines.append("")
-
-    def _generate_files_table(self, lines: list[str]) -> None:
-        lines.append("## Most Affected Files")
-        lines.append("")
-        lines.append("| File | Issues |")
-        lines.append("| ------ | -------- |")
-        for file_path, count in self.top_files[:20]:
-            lines.append(f"| `{file_path}` | {count} |")
-        lines.append("")
-
-    def _generate_rule_section(
-        self, lines: list[str], rule: str, rule_issues: list[SarifIssue]
+            out.write(f"| `{rule}` | {count} | {pct:.1f}% |\n")
+        out.write("\n")
+
+    def _write_files_table(self, out: TextIO) -> None:
+        out.write("## Most Affected Files\n\n")
+        out.write("| File | Issues |\n")
+        out.write("| ------ | -------- |\n")
+        out.writelines(
+            f"| `{file_path}` | {count} |\n" for file_path, count in self.top_files[:20]
+        )
+        out.write("\n")
+
+    def _write_rule_section(
+        self, out: TextIO, rule: str, rule_issues: list[SarifIssue]
     ) -> None:
-        lines.append(f"### {rule} ({len(rule_issues)} issues)")
-        lines.append("")
-
-        strategy = get_strategy(rule)
-        if strategy:
-            lines.append(f"**Strategy:** {strategy.title}")
-            lines.append("")
-            # Ensure blank line before list for MD032 compliance
-            lines.append(strategy.instructions.replace(":\\n-", ":\\n\\n-"))
-            lines.append("")
+        out.write(f"### {rule} ({len(rule_issues)} issues)\n\n")
+        out.write(_strategy_block(rule))
 
         # Show up to 50 issues per rule to avoid massive files
         limit = 50
         count = len(rule_issues)
 
         for issue in rule_issues[:limit]:
-            lines.append(f"#### `{issue.location_str}`")
-            lines.append("")
+            out.write(f"#### `{issue.location_str}`\n\n")
 
             func = issue.fingerprints.get("function.name")
             if func:
-                lines.append(f"- **Function:** `{func}`")
+                out.write(f"- **Function:** `{func}`\n")
 
             msg = issue.message
             if msg:
-                lines.append(f"- **Message:** {msg}")
-            lines.append("")
+                out.write(f"- **Message:** {msg}\n")
+            out.write("\n")
 
         if count > limit:
-            lines.append(f"*...and {count - limit} more issues.*")
-            lines.append("")
-
-    def _generate_severity_section(self, lines: list[str], sev: Severity) -> None:
-        sev_issues = [i for i in self.issues if i.level == sev]
-        if not sev_issues:
-            return
-
-        lines.append(f"## {sev.to_emoji()} {sev.name} Issues ({len(sev_issues)})")
-        lines.append("")
+            out.write(f"*...and {count - limit} more issues.*\n\n")
 
-        by_rule = defaultdict(list)
-        for issue in sev_issues:
-            by_rule[issue.rule_id].append(issue)
+    def _write_severity_section(
+        self, out: TextIO, sev: Severity, by_rule: dict[str, list[SarifIssue]]
+    ) -> None:
+        count = self.sev_counts[sev]
+        out.write(f"## {sev.to_emoji()} {sev.name} Issues ({count})\n\n")
 
         for rule, rule_issues in sorted(
             by_rule.items(), key=lambda x: len(x[1]), reverse=True
         ):
-            self._generate_rule_section(lines, rule, rule_issues)
-
-    def generate_markdown(self, title: str = "Quality Analysis Report") -> str:
-        """Generate detailed markdown report."""
-        lines = []
-        lines.append(f"# {title}")
-        lines.append("")
-        lines.append(f"**Total Issues:** {self.total_issues}")
-        lines.append("")
-
-        self._generate_severity_table(lines)
-        self._generate_category_table(lines)
-        self._generate_rules_table(lines)
-        self._generate_files_table(lines)
-
-        for sev in [Severity.ERROR, Severity.WARNING, Severity.INFO]:
-            self._generate_severity_section(lines, sev)
-
-        return "\\n".join(lines)
-
-
-def _populate_severity_counts(report: AnalysisReport, issues: list[SarifIssue]) -> None:
-    for issue in issues:
-        report.by_severity[issue.level] += 1
+            self._write_rule_section(out, rule, rule_issues)
 
+    def write_markdown(
+        self, out: TextIO, title: str = "Quality Analysis Report"
+    ) -> None:
+        """Stream the detailed markdown report to a text stream."""
+        out.write(f"# {title}\n\n")
+        out.write(f"**Total Issues:** {self.total_issues}\n\n")
 
-def _populate_category_and_rule_counts(
-    report: AnalysisReport, issues: list[SarifIssue]
-) -> None:
-    for issue in issues:
-        report.by_rule[issue.rule_id] += 1
-        report.by_category[issue.rule_category] += 1
+        self._write_severity_table(out)
+        self._write_category_table(out)
+        self._write_rules_table(out)
+        self._write_files_table(out)
 
+        # Only severities that actually have issues get a section
+        for sev in _SEVERITY_ORDER:
+            if sev in self.by_sev_rule:
+                self._write_severity_section(out, sev, self.by_sev_rule[sev])
 
-def _populate_file_counts(report: AnalysisReport, issues: list[SarifIssue]) -> None:
-    for issue in issues:
-        report.by_file[issue.file_path] += 1
+    def generate_markdown(self, title: str = "Quality Analysis Report") -> str:
+        """Generate detailed markdown report."""
+        buf = io.StringIO()
+        self.write_markdown(buf, title)
+        return buf.getvalue()
 
 
-def analyze_issues(issues: list[SarifIssue]) -> AnalysisReport:
-    """Generate statistical analysis of issues."""
+def analyze_issues(
+    issues: list[SarifIssue], predicates: Sequence[IssuePredicate] = ()
+) -> AnalysisReport:
+    """Generate statistical analysis of the issues accepted by every predicate."""
     report = AnalysisReport()
-    report.total_issues = len(issues)
-    report.issues = issues
 
-    _populate_severity_counts(report, issues)
-    _populate_category_and_rule_counts(report, issues)
-    _populate_file_counts(report, issues)
+    # One Python pass filters and buckets; the counters then run in C
+    kept: list[SarifIssue] = []
+    keep = kept.append
+    by_sev_rule = report.by_sev_rule
+    for issue in issues:
+        if predicates and not all(p(issue) for p in predicates):
+            continue
+        keep(issue)
+        rules = by_sev_rule.setdefault(issue.level, {})
+        rules.setdefault(issue.rule_id, []).append(issue)
+
+    report.total_issues = len(kept)
+    report.issues = kept
+    for sev, rules in by_sev_rule.items():
+        report.sev_counts[sev] = sum(map(len, rules.values()))
+    report.by_rule = Counter(map(attrgetter("rule_id"), kept))
+    report.by_category = Counter(map(attrgetter("rule_category"), kept))
+    report.by_file = Counter(map(attrgetter("file_path"), kept))
 
     report.top_files = report.by_file.most_common(20)
     report.top_rules = report.by_rule.most_common(20)
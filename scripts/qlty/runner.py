@@ -2,32 +2,51 @@
 
 import subprocess  # nosec B404
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from qlty.model import SarifIssue
 from qlty.parser import parse_sarif_file
 
+# Leading bytes inspected to tell an empty (clean) run from real SARIF output
+_BLANK_PROBE_BYTES = 4096
 
-def run_qlty_check(
-    output_file: Path = Path("qlty.check.current.sarif"),
-) -> list[SarifIssue]:
-    """Run qlty check --all --sarif, save to file, and parse SARIF output."""
+
+def _run_to_file(cmd: list[str], output_file: Path) -> bool:
+    """Stream cmd's stdout into output_file; return False if it printed nothing."""
+    # Write to a sibling temp file so a clean or failed run keeps the old output
+    tmp_file = output_file.with_name(output_file.name + ".tmp")
+    try:
+        with tmp_file.open("wb") as out:
+            subprocess.run(  # nosec B603 B607
+                cmd,
+                stdout=out,
+                stderr=subprocess.DEVNULL,
+                timeout=300,
+                check=False,
+            )
+        with tmp_file.open("rb") as f:
+            has_output = bool(f.read(_BLANK_PROBE_BYTES).strip())
+        if has_output:
+            tmp_file.replace(output_file)
+        return has_output
+    finally:
+        tmp_file.unlink(missing_ok=True)
+
+
+_CHECK_CMD = ["qlty", "check", "--all", "--sarif"]
+_SMELLS_CMD = ["qlty", "smells", "--all", "--sarif"]
+
+
+def _check_issues(output_file: Path, run: Callable[[], bool]) -> list[SarifIssue]:
     print("🔄 Running qlty check --all --sarif...")
 
     try:
-        result = subprocess.run(  # nosec B603 B607
-            ["qlty", "check", "--all", "--sarif"],
-            capture_output=True,
-            text=True,
-            timeout=300,
-            check=False,
-        )
-
-        if not result.stdout.strip():
+        if not run():
             print("   ✅ No issues found (clean)")
             return []
 
-        output_file.write_text(result.stdout, encoding="utf-8")
         print(f"   💾 Saved SARIF to {output_file}")
 
         issues = parse_sarif_file(output_file)
@@ -42,26 +61,14 @@ def run_qlty_check(
         return []
 
 
-def run_qlty_smells(
-    output_file: Path = Path("qlty.smells.sarif"),
-) -> list[SarifIssue]:
-    """Run qlty smells --all --sarif, save to file, and parse SARIF output."""
+def _smell_issues(output_file: Path, run: Callable[[], bool]) -> list[SarifIssue]:
     print("🔄 Running qlty smells --all --sarif...")
 
     try:
-        result = subprocess.run(  # nosec B603 B607
-            ["qlty", "smells", "--all", "--sarif"],
-            capture_output=True,
-            text=True,
-            timeout=300,
-            check=False,
-        )
-
-        if not result.stdout.strip():
+        if not run():
             print("   ✅ No smells found (clean)")
             return []
 
-        output_file.write_text(result.stdout, encoding="utf-8")
         print(f"   💾 Saved SARIF to {output_file}")
 
         issues = parse_sarif_file(output_file)
@@ -79,3 +86,31 @@ def run_qlty_smells(
     except (OSError, subprocess.SubprocessError) as e:
         print(f"   ❌ Error running qlty smells: {e}", file=sys.stderr)
         return []
+
+
+def run_qlty_check(
+    output_file: Path = Path("qlty.check.current.sarif"),
+) -> list[SarifIssue]:
+    """Run qlty check --all --sarif, save to file, and parse SARIF output."""
+    return _check_issues(output_file, lambda: _run_to_file(_CHECK_CMD, output_file))
+
+
+def run_qlty_smells(
+    output_file: Path = Path("qlty.smells.sarif"),
+) -> list[SarifIssue]:
+    """Run qlty smells --all --sarif, save to file, and parse SARIF output."""
+    return _smell_issues(output_file, lambda: _run_to_file(_SMELLS_CMD, output_file))
+
+
+def run_qlty_both(
+    check_file: Path = Path("qlty.check.current.sarif"),
+    smells_file: Path = Path("qlty.smells.sarif"),
+) -> tuple[list[SarifIssue], list[SarifIssue]]:
+    """Run qlty check and qlty smells concurrently; return (checks, smells)."""
+    # Both scans run at once; results are then reported in the usual order
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        check_run = pool.submit(_run_to_file, _CHECK_CMD, check_file)
+        smells_run = pool.submit(_run_to_file, _SMELLS_CMD, smells_file)
+        checks = _check_issues(check_file, check_run.result)
+        smells = _smell_issues(smells_file, smells_run.result)
+    return checks, smells